@@ -1,11 +1,12 @@
 """Prosavant Engine package exposing the AGI RRF core primitives."""
 
+from . import _thread_config  # noqa: F401  (must run before numpy is imported)
 from .config import VERSION, DEFAULT_MODEL_NAME, DEFAULT_SERVER_URI, DEFAULT_USER
 from .geometry import IcosahedralField
 from .physics import DiracHamiltonian
 from .resonance import ResonanceSimulator, harmonic_quantization
 from .self_improvement import SelfImprover
-from .data import DataRepository
+from .data import DataRepository, get_default_repository
 from .colab_utils import mount_google_drive, setup_data_repository
 from .reflection import OmegaReflection
 from .core import AGIRRFCore
@@ -22,6 +23,7 @@ __all__ = [
     "harmonic_quantization",
     "SelfImprover",
     "DataRepository",
+    "get_default_repository",
     "mount_google_drive",
     "setup_data_repository",
     "OmegaReflection",
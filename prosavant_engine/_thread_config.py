@@ -0,0 +1,35 @@
+"""Default thread-pool sizes for the native math libraries.
+
+Imported first by the package so the variables are in place before numpy,
+scipy or torch initialise their pools; values already set by the caller win.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+ENV_NUM_THREADS = "SAVANT_NUM_THREADS"
+ENV_EMBED_THREADS = "SAVANT_EMBED_THREADS"
+
+NUM_THREADS = os.getenv(ENV_NUM_THREADS, "2")
+
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, NUM_THREADS)
+
+
+def configure_torch_threads() -> None:
+    """Size torch's intra-op pool for embedding work, if torch is loaded.
+
+    Batched encoding benefits from more threads than the scalar numpy path,
+    so ``SAVANT_EMBED_THREADS`` may raise it; otherwise torch follows
+    ``OMP_NUM_THREADS``, which the caller's own setting overrides.
+    """
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        threads = os.getenv(ENV_EMBED_THREADS) or os.environ.get("OMP_NUM_THREADS", NUM_THREADS)
+        torch.set_num_threads(int(threads))
+
+
+__all__ = ["ENV_NUM_THREADS", "ENV_EMBED_THREADS", "configure_torch_threads"]
@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 import numpy as np
-import plotly.graph_objects as go
 
 from .geometry import IcosahedralField
-from .utils import to_psi3
 from .physics import DiracHamiltonian
 from .resonance import ResonanceSimulator
 from .self_improvement import SelfImprover
 from .data import DataRepository
 from .reflection import OmegaReflection
 
+if TYPE_CHECKING:  # pragma: no cover - plotly is imported on first plot
+    import plotly.graph_objects as go
+
 
 class AGIRRFCore:
     """Facade that exposes the text → resonance → response pipeline."""
@@ -34,11 +35,13 @@ class AGIRRFCore:
 
         resonance = self.simulator.simulate(text)
         dominant_frequency = resonance["dominant_frequency"]
-        # Map the resonance embedding (or the dominant frequency) to the
-        # 3-component psi expected by the Hamiltonian using a shared helper.
-        psi_source = resonance.get("embedding", np.array([dominant_frequency]))
-        psi = to_psi3(psi_source)
-        hamiltonian_energy = self.hamiltonian.H(psi)
+        # H maps the resonance embedding to its 3-component psi itself; without
+        # an embedding the state is the dominant frequency alone.
+        embedding = resonance.get("embedding")
+        if embedding is None:
+            hamiltonian_energy = self.hamiltonian.H_scalar(dominant_frequency)
+        else:
+            hamiltonian_energy = self.hamiltonian.H(embedding)
         coherence = self.self_improver.update(hamiltonian_energy)
         phi = float(np.tanh(abs(hamiltonian_energy) * 1e-6))
         omega = float(np.tanh(dominant_frequency / 1000.0))
@@ -60,6 +63,8 @@ class AGIRRFCore:
     def visualize_phi_omega(self) -> go.Figure:
         """Render a 3D trajectory of Φ/Ω over time."""
 
+        import plotly.graph_objects as go
+
         entries = list(self.omega_reflection.tail())
         if len(entries) < 2:
             return go.Figure()
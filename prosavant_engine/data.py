@@ -3,19 +3,48 @@
 from __future__ import annotations
 
 import csv
+import importlib.util
 import json
+import mmap
 import os
 import pickle
+import stat
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 try:  # pandas is optional at runtime
     import pandas as pd  # type: ignore[import-untyped]
 except Exception:  # pragma: no cover
     pd = None  # type: ignore[assignment]
 
+try:  # pyarrow is optional; a multithreaded CSV reader
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.compute as pc  # type: ignore[import-untyped]
+    import pyarrow.csv as pacsv  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    pa = pc = pacsv = None  # type: ignore[assignment]
+
+try:  # orjson is optional; a much faster JSON decoder
+    import orjson  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:  # ijson is optional; streams JSON fields when orjson is unavailable
+    import ijson  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
+
+# huggingface_hub reads this at import time; opt in to the Rust downloader
+# only when it is actually installed (enabling it without it is an error).
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 try:  # huggingface_hub is optional
     from huggingface_hub import snapshot_download  # type: ignore[import-untyped]
 except Exception:  # pragma: no cover
@@ -34,7 +63,10 @@ DEFAULT_POSSIBLE_PATHS: tuple[str, ...] = (
 
 ENV_BASE_PATH = "SAVANT_DATA_PATH"
 ENV_REMOTE_DATASET = "SAVANT_REMOTE_DATASET"
+# Data-root overrides, in priority order
+_DATA_PATH_ENV_VARS = ("RRF_DATA_ROOT", "SAVANT_RRF_DATA_DIR", "AGIRRF_DATA_DIR", ENV_BASE_PATH)
 DEFAULT_CACHE_DIR = str(Path.home() / ".cache" / "prosavant" / "datasets")
+_REPO_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "data")
 
 # Drive layout you actually use
 DEFAULT_POSSIBLE_PATHS: tuple[str, ...] = (
@@ -71,6 +103,448 @@ FREQUENCIES_BASENAMES = ("frequencies.csv",)
 CONSTANTS_BASENAMES = ("constants.csv",)
 FULL_MEMORY_BASENAMES = ("full_fractal_memory.pkl",)
 
+# Only the files the loaders can use are fetched from a remote dataset, at
+# the repo root or in any subfolder (Hub patterns are fnmatch, where "*"
+# also crosses "/").
+_REMOTE_ALLOW_PATTERNS = tuple(
+    pattern
+    for name in dict.fromkeys(
+        EQUATIONS_BASENAMES
+        + ICOSAHEDRON_NODES_BASENAMES
+        + DODECA_NODES_BASENAMES
+        + FREQUENCIES_BASENAMES
+        + CONSTANTS_BASENAMES
+        + FULL_MEMORY_BASENAMES
+    )
+    for pattern in (name, f"*/{name}")
+)
+
+# Numeric columns, tried in order (same tolerance as savant_engine.MusicAdapter)
+FREQUENCY_COLUMNS = ("frequency", "freq_hz", "freq", "f")
+CONSTANT_VALUE_COLUMNS = ("value",)
+
+# Column types of the known CSV files, by basename; passing them to pandas
+# skips dtype inference. Columns missing from a file are ignored.
+_CSV_SCHEMAS: Dict[str, Dict[str, type]] = {
+    "frequencies.csv": {"note": str, **{c: float for c in FREQUENCY_COLUMNS}},
+    "constants.csv": {"name": str, "value": float},
+}
+# Below this size a schema'd CSV is parsed with the csv module, which beats
+# pandas' per-call setup cost.
+_SMALL_CSV_BYTES = 64 * 1024
+# Cells read as missing: the default NA strings shared by pandas and Arrow,
+# so the csv-module paths agree with them
+_NA_CELLS = frozenset(
+    ("", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+     "1.#QNAN", "N/A", "NA", "NULL", "NaN", "n/a", "nan", "null")
+)
+
+
+def _scan_dir(directory: Path | str) -> FrozenSet[str]:
+    """
+    Names of the regular files in *directory*, from one os.scandir pass.
+    DirEntry type checks come from the directory listing itself, so plain
+    entries cost no extra stat. Unreadable directories yield nothing.
+    """
+    files: List[str] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return frozenset(files)
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Parse the JSON document at *path*. With orjson installed the file is
+    memory-mapped and parsed straight from the page cache, skipping the
+    intermediate bytes copy.
+    """
+    if orjson is not None:
+        try:
+            with path.open("rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        except ValueError:
+            # empty files cannot be mapped, and orjson rejects NaN literals;
+            # let the stdlib parser handle (or report) both
+            pass
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _stream_json(path: Path, keys: tuple[str, ...], keep_all: bool = False) -> Optional[Any]:
+    """
+    Parse the JSON at *path* in a single ijson pass, building only what the
+    loaders read: a top-level list in full, or for an object just its
+    top-level *keys* (every key with *keep_all*). The rest of the document
+    is still tokenized, so malformed or trailing content is rejected just
+    as :func:`_read_json` would reject it.
+
+    Only used when ijson is installed and orjson is not (a full orjson parse
+    is faster still). Returns None when streaming is unavailable or the root
+    is neither a list nor an object, in which case callers fall back to
+    :func:`_read_json`.
+    """
+    if ijson is None or orjson is not None:
+        return None
+    rank = {key: i for i, key in enumerate(keys)}
+    other = len(keys)
+    best = other
+    found: Dict[str, Any] = {}
+    with path.open("rb") as f:
+        events = ijson.parse(f, use_float=True)
+        try:
+            _, event, value = next(events)
+            if event == "start_array":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                for _, event, value in events:
+                    builder.event(event, value)
+                return builder.value
+            if event != "start_map":
+                return None
+            for _, event, key in events:
+                if event == "end_map":
+                    break
+                # *event* is a top-level map_key; consume the value after it
+                i = rank.get(key, other)
+                builder = ijson.ObjectBuilder() if i < best or (keep_all and i == other) else None
+                depth = 0
+                for _, event, value in events:
+                    if builder is not None:
+                        builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                    if depth == 0:
+                        break
+                if builder is not None:
+                    found[key] = builder.value
+                    best = min(best, i)
+            # exhaust the parser so trailing data after the root raises
+            for _ in events:
+                pass
+        except ijson.JSONError:
+            return None
+    return found
+
+
+def _read_small_csv(path: Path, schema: Dict[str, type]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Parse a small CSV with the csv module, typing cells like
+    ``pd.read_csv(path, dtype=schema)`` would: blank lines are skipped and
+    empty, missing or NA cells become NaN. Returns None when a column has no
+    schema entry or a cell does not convert, so pandas can handle the file.
+    """
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None or not all(name in schema for name in header):
+            return None
+        types = [schema[name] for name in header]
+        nan = float("nan")
+        rows = []
+        try:
+            for row in reader:
+                if not row:
+                    continue
+                row += [""] * (len(header) - len(row))
+                rows.append(
+                    {
+                        name: nan if cell in _NA_CELLS else kind(cell)
+                        for name, kind, cell in zip(header, types, row)
+                    }
+                )
+        except ValueError:
+            return None
+    return rows
+
+
+# ----------------------------------------------------------------------
+# File parsers (one per artefact; DataRepository memoizes their results)
+# ----------------------------------------------------------------------
+
+
+def _parse_equations(path: Path) -> List[Dict[str, Any]]:
+    data = _stream_json(path, ("ecuaciones", "ecuaciones_maestras"))
+    if data is None:
+        data = _read_json(path)
+
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        # matches icosahedron_nodes.json structure
+        if "ecuaciones" in data:
+            return data["ecuaciones"]
+        if "ecuaciones_maestras" in data:
+            return data["ecuaciones_maestras"]
+    return []
+
+
+def _parse_icosahedron_nodes(path: Path) -> List[Dict[str, Any]]:
+    data = _stream_json(path, ("nodes",))
+    if data is None:
+        data = _read_json(path)
+    if isinstance(data, dict) and "nodes" in data:
+        return data["nodes"]
+    if isinstance(data, list):
+        return data
+    return []
+
+
+def _parse_dodecahedron_nodes(path: Path) -> Any:
+    # without "nodes" the whole object is returned, so keep every key
+    data = _stream_json(path, ("nodes",), keep_all=True)
+    if data is None:
+        data = _read_json(path)
+    return data.get("nodes", data) if isinstance(data, dict) else data
+
+
+def _read_csv_rows(path: Path) -> tuple[List[str], List[List[str]]]:
+    """Header and non-blank rows of the CSV at *path*, as lists of strings."""
+    with path.open("r", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        return header, [row for row in reader if row]
+
+
+def _parse_csv(path: Path) -> List[Dict[str, Any]]:
+    schema = _CSV_SCHEMAS.get(path.name)
+    if schema is not None and (pd is not None or pacsv is not None):
+        if path.stat().st_size < _SMALL_CSV_BYTES:
+            rows = _read_small_csv(path, schema)
+            if rows is not None:
+                return rows
+        if pacsv is not None:
+            table = _read_arrow_table(path, schema)
+            if table is not None:
+                return _arrow_records(table)
+
+    if pd is None:
+        # csv.reader + zip builds the same rows as csv.DictReader without its
+        # per-row bookkeeping; ragged rows are padded / collected the same way
+        header, rows = _read_csv_rows(path)
+        width = len(header)
+        records = []
+        for row in rows:
+            record = dict(zip(header, row))
+            if len(row) > width:
+                record[None] = row[width:]  # type: ignore[index]
+            elif len(row) < width:
+                record.update(dict.fromkeys(header[len(row):]))
+            records.append(record)
+        return records
+
+    if schema is not None:
+        try:
+            df = pd.read_csv(path, dtype=schema, engine="c")
+        except ValueError:
+            # a column does not match its schema type; infer instead
+            df = pd.read_csv(path, engine="c")
+    else:
+        df = pd.read_csv(path, engine="c")
+    return df.to_dict(orient="records")
+
+
+def _read_arrow_table(path: Path, schema: Optional[Dict[str, type]]) -> Optional[Any]:
+    """
+    Read a CSV into an Arrow table with PyArrow's multithreaded reader,
+    typing columns by *schema*. Returns None for files Arrow cannot parse.
+    """
+    try:
+        return pacsv.read_csv(path, convert_options=_arrow_convert_options(schema))
+    except pa.ArrowInvalid:
+        if schema is None:
+            return None
+    # a column does not match its schema type (infer instead), or the file
+    # is ragged, which Arrow rejects (leave it to pandas / csv)
+    try:
+        return pacsv.read_csv(path, convert_options=_arrow_convert_options(None))
+    except pa.ArrowInvalid:
+        return None
+
+
+def _arrow_convert_options(schema: Optional[Dict[str, type]]) -> Any:
+    types = {} if schema is None else {
+        name: pa.string() if kind is str else pa.float64() for name, kind in schema.items()
+    }
+    return pacsv.ConvertOptions(column_types=types, strings_can_be_null=True)
+
+
+def _arrow_records(table: Any) -> List[Dict[str, Any]]:
+    """Rows of an Arrow table or record batch, with nulls as NaN like pandas."""
+    nan = float("nan")
+    columns = []
+    for column in table.columns:
+        if column.null_count:
+            if pa.types.is_integer(column.type):
+                column = column.cast(pa.float64())
+            if pa.types.is_floating(column.type):
+                values = pc.fill_null(column, nan).to_pylist()
+            else:
+                values = [nan if v is None else v for v in column.to_pylist()]
+        else:
+            values = column.to_pylist()
+        columns.append(values)
+    names = table.column_names
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def _iter_csv(path: Path, chunksize: int) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the rows of the CSV at *path* with bounded memory: PyArrow's
+    incremental reader (blocks of roughly *chunksize* short rows), else
+    pandas in *chunksize*-row chunks, else the csv module (string cells).
+    Types follow _CSV_SCHEMAS where known; since rows are produced as they
+    are read, a file that breaks its schema fails mid-iteration.
+    """
+    schema = _CSV_SCHEMAS.get(path.name)
+    if pacsv is not None:
+        reader = pacsv.open_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=max(chunksize * 32, 1 << 20)),
+            convert_options=_arrow_convert_options(schema),
+        )
+        for batch in reader:
+            yield from _arrow_records(batch)
+        return
+    if pd is not None:
+        with pd.read_csv(path, dtype=schema, engine="c", chunksize=chunksize) as chunks:
+            for chunk in chunks:
+                yield from chunk.to_dict(orient="records")
+        return
+    with path.open("r", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        yield from csv.DictReader(handle)
+
+
+def _parse_csv_columnar(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Column name → array for the CSV at *path*. Numeric columns are float64
+    and text columns object arrays of str; missing cells are NaN in both.
+    Columns typed in _CSV_SCHEMAS keep their type, others are inferred.
+    """
+    schema = _CSV_SCHEMAS.get(path.name)
+    if pacsv is not None:
+        table = _read_arrow_table(path, schema)
+        if table is not None:
+            return _arrow_columns(table)
+    if pd is not None:
+        try:
+            df = pd.read_csv(path, dtype=schema, engine="c")
+        except ValueError:
+            df = pd.read_csv(path, engine="c")
+        return {
+            name: df[name].to_numpy(
+                dtype=np.float64 if pd.api.types.is_numeric_dtype(df[name]) else object
+            )
+            for name in df.columns
+        }
+
+    header, rows = _read_csv_rows(path)
+    text = {name for name, kind in (schema or {}).items() if kind is str}
+    if not rows:
+        return {
+            name: np.empty(0, dtype=object if name in text else np.float64)
+            for name in header
+        }
+    width = len(header)
+    columns = zip(*(row[:width] + [""] * (width - len(row)) for row in rows))
+    out: Dict[str, np.ndarray] = {}
+    for name, cells in zip(header, columns):
+        if name not in text:
+            try:
+                out[name] = np.fromiter(
+                    (np.nan if cell in _NA_CELLS else float(cell) for cell in cells),
+                    dtype=np.float64,
+                    count=len(cells),
+                )
+                continue
+            except ValueError:
+                pass
+        out[name] = np.array(
+            [np.nan if cell in _NA_CELLS else cell for cell in cells], dtype=object
+        )
+    return out
+
+
+def _arrow_columns(table: Any) -> Dict[str, np.ndarray]:
+    """Columns of an Arrow table as _parse_csv_columnar returns them."""
+    out: Dict[str, np.ndarray] = {}
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+            # nulls come out as NaN
+            out[name] = column.cast(pa.float64()).to_numpy()
+        else:
+            values = np.array(column.to_pylist(), dtype=object)
+            if column.null_count:
+                values[pc.is_null(column).to_numpy()] = np.nan
+            out[name] = values
+    return out
+
+
+def _float_or_nan(cell: Any) -> float:
+    """*cell* as a float; empty or unparseable cells are NaN."""
+    try:
+        return np.nan if cell in _NA_CELLS else float(cell)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _first_float_column(columns: Dict[str, np.ndarray], names: tuple[str, ...]) -> np.ndarray:
+    """
+    The first of *names* in *columns* (a _parse_csv_columnar result) as
+    float64; text cells that do not parse are NaN.
+    """
+    values = next((columns[name] for name in names if name in columns), None)
+    if values is None:
+        return np.empty(0, dtype=np.float64)
+    if values.dtype == np.float64:
+        return values
+    return np.fromiter(map(_float_or_nan, values), dtype=np.float64, count=len(values))
+
+
+def _parse_pickle(path: Path) -> Any:
+    """
+    Unpickle straight from a read-only memory map instead of streaming the
+    file through Python-level reads. Producers should dump with
+    ``protocol=5`` so large NumPy arrays are framed as contiguous raw
+    buffers; the loaded objects still own their data, so the map is closed
+    before returning.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped; let pickle raise its usual EOFError
+            return pickle.load(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
+
+
+# _memoized's marker for "not looked up yet" (None means "no such file")
+_UNLOCATED = object()
+
+_load_pool_lock = Lock()
+_load_pool_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _load_pool() -> ThreadPoolExecutor:
+    """Process-wide executor for load_structured_bundle, created on first use."""
+    global _load_pool_executor
+    with _load_pool_lock:
+        if _load_pool_executor is None:
+            _load_pool_executor = ThreadPoolExecutor(
+                max_workers=6, thread_name_prefix="prosavant-data"
+            )
+        return _load_pool_executor
+
 
 @dataclass
 class DataRepository:
@@ -94,6 +568,12 @@ class DataRepository:
     log_filename: str = "omega_log.jsonl"
 
     def __post_init__(self) -> None:
+        # lookup and parse caches; plain attributes rather than fields, so
+        # they stay out of __eq__, repr() and dataclasses.asdict()
+        self._listings: Dict[Path, FrozenSet[str]] = {}
+        self._roots: Optional[Tuple[Any, List[Path]]] = None
+        self._resolved: Dict[Tuple[str, ...], Tuple[Any, Path]] = {}
+        self._loaded: Dict[Tuple[Hashable, Path], Tuple[Tuple[int, int], Any]] = {}
         self.base_path = self._initial_base_path()
         if self.base_path is None and self.remote_dataset:
             self.base_path = self._download_remote_dataset(self.remote_dataset)
@@ -110,43 +590,42 @@ class DataRepository:
         3. DEFAULT_POSSIBLE_PATHS
         4. repo_root/data as a last local fallback
         """
+        # Probe with plain strings; only the winning candidate becomes a Path.
         # 1) explicit override
         if self.base_path:
-            candidate = Path(self.base_path).expanduser()
-            if candidate.exists():
-                return candidate
+            candidate = os.path.expanduser(self.base_path)
+            if os.path.exists(candidate):
+                return Path(candidate)
 
         # 2) env overrides used across your notebooks/scripts
-        env = (
-            os.getenv("RRF_DATA_ROOT")
-            or os.getenv("SAVANT_RRF_DATA_DIR")
-            or os.getenv("AGIRRF_DATA_DIR")
-            or os.getenv(ENV_BASE_PATH)
-        )
+        env = next(filter(None, map(os.getenv, _DATA_PATH_ENV_VARS)), None)
         if env:
-            p = Path(env).expanduser()
-            if p.exists():
-                return p
+            p = os.path.expanduser(env)
+            if os.path.exists(p):
+                return Path(p)
 
         # 3) drive defaults + additional hints
-        search_roots: List[str] = list(DEFAULT_POSSIBLE_PATHS)
-        if self.additional_paths:
-            search_roots.extend(self.additional_paths)
-
-        for raw in search_roots:
-            p = Path(raw).expanduser()
-            if p.exists():
-                return p
+        for raw in (*DEFAULT_POSSIBLE_PATHS, *self.additional_paths):
+            p = os.path.expanduser(raw)
+            if os.path.exists(p):
+                return Path(p)
 
         # 4) repo-local data/ as a last resort
-        repo_root = Path(__file__).resolve().parent.parent
-        candidate = repo_root / "data"
-        return candidate if candidate.exists() else None
+        return Path(_REPO_DATA_DIR) if os.path.exists(_REPO_DATA_DIR) else None
 
     def _candidate_roots(self) -> List[Path]:
         """
-        Build an ordered list of directories to search for structured files.
+        Ordered list of directories to search for structured files, built
+        once per base_path (de-duplicating resolves every candidate).
         """
+        cached = self._roots
+        if cached is not None and cached[0] == self.base_path:
+            return cached[1]
+        roots = self._build_candidate_roots()
+        self._roots = (self.base_path, roots)
+        return roots
+
+    def _build_candidate_roots(self) -> List[Path]:
         roots: List[Path] = []
 
         if self.base_path is not None:
@@ -186,15 +665,37 @@ class DataRepository:
                 seen.add(key)
         return uniq
 
+    def _listing(self, directory: Path) -> FrozenSet[str]:
+        """Regular files in *directory*, scanned once per repository."""
+        names = self._listings.get(directory)
+        if names is None:
+            names = _scan_dir(directory)
+            self._listings[directory] = names
+        return names
+
     def _resolve_first_existing(self, *names: str) -> Optional[Path]:
         if not names:
             return None
-        for root in self._candidate_roots():
-            for name in names:
-                candidate = root / name
-                if candidate.is_file():
-                    return candidate
-        return None
+        # hits are memoized per names tuple until base_path changes (_locate
+        # re-checks them); misses are not, so files that appear later, e.g.
+        # once Drive is mounted, are still found
+        hit = self._resolved.get(names)
+        if hit is not None and hit[0] == self.base_path:
+            return hit[1]
+        roots = self._candidate_roots()
+        found = next(
+            (root / name for root in roots for name in names if name in self._listing(root)),
+            None,
+        )
+        if found is None:
+            # the listings may predate the file; probe it directly
+            found = next(
+                (root / name for root in roots for name in names if (root / name).is_file()),
+                None,
+            )
+        if found is not None:
+            self._resolved[names] = (self.base_path, found)
+        return found
 
     # ------------------------------------------------------------------
     # Remote dataset support via Hugging Face Hub (optional)
@@ -203,7 +704,8 @@ class DataRepository:
     def _download_remote_dataset(self, repo_id: str) -> Optional[Path]:
         """
         Download a remote dataset snapshot from the Hugging Face Hub and
-        return a directory that contains our structured markers.
+        return a directory that contains our structured markers. Snapshots
+        already on disk are used as-is.
         """
         if not repo_id:
             return None
@@ -216,13 +718,32 @@ class DataRepository:
             return None
 
         cache_dir = Path(self.cache_dir).expanduser()
-        cache_dir.mkdir(parents=True, exist_ok=True)
         local_dir = cache_dir / repo_id.replace("/", "__")
+        # A previous download, here or in the shared Hugging Face cache
+        # (HF_HOME / HF_HUB_CACHE), is reused without touching the network.
+        if local_dir.is_dir():
+            structured_root = self._locate_structured_root(local_dir)
+            if structured_root is not None:
+                return structured_root
+        try:
+            cached = snapshot_download(
+                repo_id=repo_id, repo_type="dataset", local_files_only=True
+            )
+        except Exception:
+            cached = None
+        if cached is not None:
+            structured_root = self._locate_structured_root(Path(cached))
+            if structured_root is not None:
+                return structured_root
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
         try:
             snapshot_path = snapshot_download(
                 repo_id=repo_id,
                 repo_type="dataset",
                 local_dir=str(local_dir),
+                allow_patterns=list(_REMOTE_ALLOW_PATTERNS),
+                max_workers=8,
             )
         except Exception as exc:  # pragma: no cover
             warnings.warn(
@@ -237,16 +758,119 @@ class DataRepository:
 
     def _locate_structured_root(self, root: Path) -> Optional[Path]:
         """Search `root` for a directory containing structured data markers."""
-        markers = set(STRUCTURED_MARKERS)
-        for current, _dirs, files in os.walk(root):
-            if markers.intersection(files):
-                return Path(current)
+        markers = frozenset(STRUCTURED_MARKERS)
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            subdirs: List[str] = []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            # stop listing as soon as a marker file turns up
+                            if entry.name in markers and entry.is_file():
+                                return Path(current)
+                            # hidden dirs (.cache, .git) only hold hub metadata;
+                            # symlinks are not followed, as in os.walk
+                            if not entry.name.startswith(".") and entry.is_dir(
+                                follow_symlinks=False
+                            ):
+                                subdirs.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            # reversed so the first subdirectory is visited next, like os.walk
+            stack.extend(reversed(subdirs))
         return None
 
     # ------------------------------------------------------------------
     # Typed loaders for your six core assets
     # ------------------------------------------------------------------
 
+    def _forget(self, path: Path) -> None:
+        """Drop every cached lookup and parse result that points at *path*."""
+        # bundle workers may insert while this runs: iterate over snapshots
+        # and tolerate entries another worker already dropped
+        self._listings.pop(path.parent, None)
+        for names, hit in list(self._resolved.items()):
+            if hit[1] == path:
+                self._resolved.pop(names, None)
+        for key in list(self._loaded):
+            if key[1] == path:
+                self._loaded.pop(key, None)
+
+    def _locate(self, names: tuple[str, ...]) -> Optional[Tuple[Path, os.stat_result]]:
+        """
+        Resolve *names* to a regular file and stat it. A cached hit that has
+        since vanished (e.g. a remounted Drive) is forgotten and looked up
+        once more; None when no file is left.
+        """
+        for _attempt in range(2):
+            path = self._resolve_first_existing(*names)
+            if path is None:
+                return None
+            try:
+                st = path.stat()
+            except OSError:
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                return path, st
+            self._forget(path)
+        return None
+
+    def _memoized(
+        self,
+        kind: Hashable,
+        names: tuple[str, ...],
+        parse: Callable[[Path], Any],
+        default: Callable[[], Any],
+        located: Any = _UNLOCATED,
+    ) -> Any:
+        """
+        Return ``parse(path)`` for the first of *names* found, reusing the
+        previous result for *kind* while the file's mtime and size are
+        unchanged, or ``default()`` when there is no such file. Results are
+        shared between calls, so callers must not mutate them.
+
+        *located* is a fresh ``_locate(names)`` result the caller already has.
+        """
+        for _attempt in range(2):
+            if located is _UNLOCATED:
+                located = self._locate(names)
+            if located is None:
+                return default()
+            path, st = located
+            key = (kind, path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            hit = self._loaded.get(key)
+            if hit is not None and hit[0] == stamp:
+                return hit[1]
+            try:
+                value = parse(path)
+            except FileNotFoundError:
+                # removed between the stat and the read
+                self._forget(path)
+                located = _UNLOCATED
+                continue
+            self._loaded[key] = (stamp, value)
+            return value
+        return default()
+
+    def _is_current(
+        self, kind: Hashable, located: Optional[Tuple[Path, os.stat_result]]
+    ) -> bool:
+        """
+        True when a _memoized load of *kind* from *located* (a _locate
+        result) would not parse anything: there is no file, or its stored
+        result is still current.
+        """
+        if located is None:
+            return True
+        path, st = located
+        hit = self._loaded.get((kind, path))
+        return hit is not None and hit[0] == (st.st_mtime_ns, st.st_size)
+
     def load_equations(self) -> List[Dict[str, Any]]:
         """
         Load equations as a list[dict] from:
@@ -254,86 +878,115 @@ class DataRepository:
           - dataset_rrf.json         (optional)
           - icosahedron_nodes.json   (fallback: uses 'ecuaciones' field)
         """
-        path = self._resolve_first_existing(*EQUATIONS_BASENAMES)
-        if not path:
-            return []
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if isinstance(data, list):
-            return data
-        if isinstance(data, dict):
-            # matches icosahedron_nodes.json structure
-            if "ecuaciones" in data:
-                return data["ecuaciones"]
-            if "ecuaciones_maestras" in data:
-                return data["ecuaciones_maestras"]
-        return []
+        return self._memoized("equations", EQUATIONS_BASENAMES, _parse_equations, list)
 
     def load_icosahedron_nodes(self) -> List[Dict[str, Any]]:
         """
         Load icosahedral nodes as list[dict] with keys (id, x, y, z, ...).
         """
-        path = self._resolve_first_existing(*ICOSAHEDRON_NODES_BASENAMES)
-        if not path:
-            return []
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, dict) and "nodes" in data:
-            return data["nodes"]
-        if isinstance(data, list):
-            return data
-        return []
+        return self._memoized(
+            "icosahedron_nodes", ICOSAHEDRON_NODES_BASENAMES, _parse_icosahedron_nodes, list
+        )
+
+    def load_icosahedron_coords(self) -> np.ndarray:
+        """
+        Icosahedral node positions as an (N, 3) float32 array of x, y, z.
+        Nodes without all three coordinates are skipped.
+        """
+        coords = [
+            (node["x"], node["y"], node["z"])
+            for node in self.load_icosahedron_nodes()
+            if isinstance(node, dict) and {"x", "y", "z"} <= node.keys()
+        ]
+        return np.asarray(coords, dtype=np.float32).reshape(-1, 3)
 
     def load_dodecahedron_nodes(self) -> List[Dict[str, Any]]:
         """
         Load dodecahedral nodes if you provide a nodes_dodecahedron.json file.
         """
-        path = self._resolve_first_existing(*DODECA_NODES_BASENAMES)
-        if not path:
-            return []
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("nodes", data) if isinstance(data, dict) else data
+        return self._memoized(
+            "dodecahedron_nodes", DODECA_NODES_BASENAMES, _parse_dodecahedron_nodes, list
+        )
 
     def _load_csv(self, *names: str) -> List[Dict[str, Any]]:
         """
         CSV loader that returns list[dict]. Uses pandas if available,
         otherwise csv.DictReader.
         """
-        path = self._resolve_first_existing(*names)
-        if not path:
-            return []
+        return self._memoized("csv", names, _parse_csv, list)
 
-        if pd is None:
-            with path.open("r", encoding="utf-8", newline="") as handle:
-                reader = csv.DictReader(handle)
-                return [dict(row) for row in reader]
+    def _load_csv_columnar(self, *names: str) -> Dict[str, np.ndarray]:
+        """
+        CSV loader that returns one array per column instead of per-row
+        dicts; see _parse_csv_columnar.
+        """
+        return self._memoized("csv_columnar", names, _parse_csv_columnar, dict)
 
-        df = pd.read_csv(path)
-        return df.to_dict(orient="records")
+    def iter_csv(self, *names: str, chunksize: int = 100_000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the rows of the first CSV found among *names* without
+        materializing the whole file; see _iter_csv. Yields nothing if no
+        file is found.
+        """
+        located = self._locate(names)
+        if located is not None:
+            yield from _iter_csv(located[0], chunksize)
+
+    def iter_frequencies(self, chunksize: int = 100_000) -> Iterator[Dict[str, Any]]:
+        """
+        Frequencies CSV → rows streamed one at a time, for files too large
+        for load_frequencies().
+        """
+        return self.iter_csv(*FREQUENCIES_BASENAMES, chunksize=chunksize)
 
     def load_frequencies(self) -> List[Dict[str, Any]]:
         """
         Frequencies CSV → list of rows with keys e.g. 'note', 'frequency'.
+        Numeric consumers should prefer load_frequencies_columnar().
         """
         return self._load_csv(*FREQUENCIES_BASENAMES)
 
     def load_constants(self) -> List[Dict[str, Any]]:
         """
         Constants CSV → list of rows with keys e.g. 'name', 'value'.
+        Numeric consumers should prefer load_constants_columnar().
         """
         return self._load_csv(*CONSTANTS_BASENAMES)
 
+    def load_frequencies_columnar(self) -> Dict[str, np.ndarray]:
+        """
+        Frequencies CSV → one array per column, e.g. {'note': object array,
+        'frequency': float64 array}, with no per-row dicts.
+        """
+        return self._load_csv_columnar(*FREQUENCIES_BASENAMES)
+
+    def load_constants_columnar(self) -> Dict[str, np.ndarray]:
+        """
+        Constants CSV → one array per column, e.g. {'name': object array,
+        'value': float64 array}, with no per-row dicts.
+        """
+        return self._load_csv_columnar(*CONSTANTS_BASENAMES)
+
+    def load_frequency_values(self) -> np.ndarray:
+        """
+        Frequencies CSV → 1-D float64 array of the frequency column (Hz).
+        """
+        return _first_float_column(self.load_frequencies_columnar(), FREQUENCY_COLUMNS)
+
+    def load_constant_values(self) -> np.ndarray:
+        """
+        Constants CSV → 1-D float64 array of the 'value' column, in the
+        same row order as load_constants().
+        """
+        return _first_float_column(self.load_constants_columnar(), CONSTANT_VALUE_COLUMNS)
+
     def load_full_fractal_memory(self) -> Any:
         """
         Load full_fractal_memory.pkl if available, otherwise return None.
         """
-        path = self._resolve_first_existing(*FULL_MEMORY_BASENAMES)
-        if not path:
-            return None
-        with path.open("rb") as f:
-            return pickle.load(f)
+        return self._memoized(
+            "full_fractal_memory", FULL_MEMORY_BASENAMES, _parse_pickle, lambda: None
+        )
 
     # ------------------------------------------------------------------
     # Bundles compatible with existing code
@@ -342,15 +995,47 @@ class DataRepository:
     def load_structured_bundle(self) -> Dict[str, Any]:
         """
         Rich bundle used by AGI–RRF or Savant-style cores.
+
+        Files that still need parsing load on a shared thread pool. Reads,
+        and the pandas / Arrow CSV parsers, release the GIL, so this mainly
+        overlaps I/O on slow storage such as a mounted Drive; the pure-Python
+        JSON and pickle parsing still runs one file at a time.
         """
-        return {
-            "equations": self.load_equations(),
-            "icosahedron_nodes": self.load_icosahedron_nodes(),
-            "dodecahedron_nodes": self.load_dodecahedron_nodes(),
-            "frequencies": self.load_frequencies(),
-            "constants": self.load_constants(),
-            "full_fractal_memory": self.load_full_fractal_memory(),
+        # the same (kind, names, parse, default) as the individual loaders,
+        # so the bundle and load_*() share memoized results
+        assets: Dict[str, Tuple[Any, ...]] = {
+            "equations": ("equations", EQUATIONS_BASENAMES, _parse_equations, list),
+            "icosahedron_nodes": (
+                "icosahedron_nodes", ICOSAHEDRON_NODES_BASENAMES, _parse_icosahedron_nodes, list
+            ),
+            "dodecahedron_nodes": (
+                "dodecahedron_nodes", DODECA_NODES_BASENAMES, _parse_dodecahedron_nodes, list
+            ),
+            "frequencies": ("csv", FREQUENCIES_BASENAMES, _parse_csv, list),
+            "constants": ("csv", CONSTANTS_BASENAMES, _parse_csv, list),
+            "full_fractal_memory": (
+                "full_fractal_memory", FULL_MEMORY_BASENAMES, _parse_pickle, lambda: None
+            ),
+        }
+        # each file is located (and stat-ed) once, then handed to its load
+        located = {name: self._locate(spec[1]) for name, spec in assets.items()}
+        pending = [
+            name for name, spec in assets.items() if not self._is_current(spec[0], located[name])
+        ]
+        futures = {}
+        if len(pending) > 1:
+            pool = _load_pool()
+            futures = {
+                name: pool.submit(self._memoized, *assets[name], located[name])
+                for name in pending
+            }
+        bundle = {
+            name: self._memoized(*spec, located[name])
+            for name, spec in assets.items()
+            if name not in futures
         }
+        bundle.update((name, future.result()) for name, future in futures.items())
+        return {name: bundle[name] for name in assets}
 
     def load_structured(self) -> Dict[str, Any]:
         """
@@ -387,8 +1072,31 @@ class DataRepository:
         return str(directory / self.log_filename)
 
 
+_default_repositories: Dict[Tuple[Any, ...], DataRepository] = {}
+
+
+def get_default_repository(
+    base_path: Optional[Path | str] = None, remote_dataset: Optional[str] = None
+) -> DataRepository:
+    """
+    Shared DataRepository for the given arguments and data-path environment,
+    so repeated callers reuse one instance (and its parsed-file memo).
+
+    A repository that found no data is not kept: the next call builds a new
+    one, which picks up a Drive mounted or a data path exported since.
+    """
+    key = (base_path, remote_dataset, *(os.getenv(var) for var in _DATA_PATH_ENV_VARS))
+    repository = _default_repositories.get(key)
+    if repository is None or repository.base_path is None:
+        repository = DataRepository(base_path=base_path, remote_dataset=remote_dataset)
+        if repository.base_path is not None:
+            _default_repositories[key] = repository
+    return repository
+
+
 __all__ = [
     "DataRepository",
+    "get_default_repository",
     "DEFAULT_POSSIBLE_PATHS",
     "EQUATIONS_BASENAMES",
     "ICOSAHEDRON_NODES_BASENAMES",
@@ -396,4 +1104,6 @@ __all__ = [
     "FREQUENCIES_BASENAMES",
     "CONSTANTS_BASENAMES",
     "FULL_MEMORY_BASENAMES",
+    "FREQUENCY_COLUMNS",
+    "CONSTANT_VALUE_COLUMNS",
 ]
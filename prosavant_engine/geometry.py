@@ -2,38 +2,81 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
+from .utils import njit
+
+_G = 6.6743e-11
+_M = 1.0
+
+
+@njit(cache=True, fastmath=True)
+def _v_log_scalar(r: float, alpha: float, r0: float) -> float:
+    return -(_G * _M / r) * (1.0 + alpha * math.log(r / r0))
+
+
+@njit(cache=True, fastmath=True)
+def _v_log_arr(r: np.ndarray, alpha: float, r0: float) -> np.ndarray:
+    safe_r = np.maximum(r, 1e-9)
+    return -(_G * _M / safe_r) * (1.0 + alpha * np.log(safe_r / r0))
+
+
+_VERTICES = np.array(
+    [
+        [0.0, 0.0, 1.0],
+        [0.894, 0.0, 0.447],
+        [0.276, 0.851, 0.447],
+        [-0.724, 0.526, 0.447],
+        [-0.724, -0.526, 0.447],
+        [0.276, -0.851, 0.447],
+        [0.724, 0.526, -0.447],
+        [-0.276, 0.851, -0.447],
+        [-0.894, 0.0, -0.447],
+        [-0.276, -0.851, -0.447],
+        [0.724, -0.526, -0.447],
+        [0.0, 0.0, -1.0],
+    ],
+    dtype=np.float32,
+)
+_VERTICES.setflags(write=False)
+# Column (structure-of-arrays) views for broadcasting against point batches.
+_VX = np.ascontiguousarray(_VERTICES[:, 0])
+_VY = np.ascontiguousarray(_VERTICES[:, 1])
+_VZ = np.ascontiguousarray(_VERTICES[:, 2])
+
+
+def pairwise_distances(points: np.ndarray) -> np.ndarray:
+    """Return the ``(N, 12)`` Euclidean distances from *points* to each vertex."""
+
+    pts = np.atleast_2d(np.asarray(points, dtype=np.float32))
+    if pts.ndim != 2 or pts.shape[1] != 3:
+        raise ValueError(f"pairwise_distances expects (N, 3) points, got {pts.shape}")
+    dx = pts[:, 0:1] - _VX
+    dy = pts[:, 1:2] - _VY
+    dz = pts[:, 2:3] - _VZ
+    return np.sqrt(dx * dx + dy * dy + dz * dz)
+
 
 class IcosahedralField:
     """Defines the RIS-CLURM icosahedral vertex field and potentials."""
 
     def __init__(self) -> None:
-        self.vertices = np.array(
-            [
-                [0.0, 0.0, 1.0],
-                [0.894, 0.0, 0.447],
-                [0.276, 0.851, 0.447],
-                [-0.724, 0.526, 0.447],
-                [-0.724, -0.526, 0.447],
-                [0.276, -0.851, 0.447],
-                [0.724, 0.526, -0.447],
-                [-0.276, 0.851, -0.447],
-                [-0.894, 0.0, -0.447],
-                [-0.276, -0.851, -0.447],
-                [0.724, -0.526, -0.447],
-                [0.0, 0.0, -1.0],
-            ]
-        )
+        # Shared read-only constant; every field uses the same 12 vertices.
+        self.vertices = _VERTICES
         self.alpha = 0.05
         self.r0 = 1.0
 
     def V_log(self, r: float) -> float:
         """Compute the logarithmic gravitational correction potential."""
 
-        G, M = 6.6743e-11, 1.0
-        safe_r = max(r, 1e-9)
-        return -(G * M / safe_r) * (1 + self.alpha * np.log(safe_r / self.r0))
+        return float(_v_log_scalar(max(float(r), 1e-9), self.alpha, self.r0))
+
+    def V_log_batch(self, r: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`V_log` over an array of radii."""
+
+        return _v_log_arr(np.asarray(r, dtype=np.float64), self.alpha, self.r0)
 
 
-__all__ = ["IcosahedralField"]
+__all__ = ["IcosahedralField", "pairwise_distances"]
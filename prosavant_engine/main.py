@@ -6,11 +6,21 @@ import argparse
 import asyncio
 import contextlib
 import json
-from typing import Iterable
+from typing import Any, Coroutine, Iterable
 
 from .config import DEFAULT_SERVER_URI, DEFAULT_USER
 from .core import AGIRRFCore
-from .networking import listen_to_field, send_to_field, start_server
+from .networking import (
+    close_field_connections,
+    listen_to_field,
+    send_to_field,
+    start_server,
+)
+
+try:  # uvloop is optional; a faster drop-in event loop on POSIX
+    import uvloop  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    uvloop = None  # type: ignore[assignment]
 
 DEFAULT_ACTIVATION_MESSAGE = "AGI–RRF Φ9.0-Δ field activation"
 
@@ -29,12 +39,12 @@ def launch(
     resolved_mode = _resolve_mode(mode)
     if resolved_mode == "server":
         try:
-            asyncio.run(start_server(host=host, port=port))
+            _run(start_server(host=host, port=port))
         except KeyboardInterrupt:
             pass
     elif resolved_mode == "client":
         try:
-            asyncio.run(
+            _run(
                 _client_mode(
                     server_uri=server_uri,
                     user=user,
@@ -47,6 +57,15 @@ def launch(
         _run_cli()
 
 
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run *coro* to completion, on uvloop when it is installed."""
+
+    if uvloop is not None:
+        uvloop.run(coro)
+    else:
+        asyncio.run(coro)
+
+
 def _resolve_mode(mode: str | None) -> str:
     value = mode or input("Mode [core/server/client]: ").strip().lower()
     if value not in {"core", "server", "client"}:
@@ -88,6 +107,7 @@ async def _client_mode(
         listener_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await listener_task
+        await close_field_connections()
 
 
 def main(argv: Iterable[str] | None = None) -> None:
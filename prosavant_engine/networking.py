@@ -3,37 +3,131 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import importlib.util
 import json
 import os
 import time
+import weakref
 from threading import Lock
-from typing import List
+from typing import Any, Dict, List, Sequence, Tuple
 
 import numpy as np
-import plotly.graph_objects as go
 import websockets
 from websockets.server import WebSocketServerProtocol
 
 from .config import VERSION
 
+try:  # msgpack lets vectors travel as raw float32 bytes
+    import msgpack  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
 
-def _get_embedder():
-    from .resonance import get_embedder
+try:  # orjson is optional; faster JSON for the text-frame fallback
+    import orjson  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
-    return get_embedder()
 
+def _get_batcher():
+    from .resonance import get_batcher
 
+    return get_batcher()
+
+
+# umap and plotly are slow to import; probe here and import on first render.
 UMAP_AVAILABLE = importlib.util.find_spec("umap") is not None
-if UMAP_AVAILABLE:
-    from umap import UMAP
-else:  # pragma: no cover - fallback path when UMAP is absent
-    UMAP = None  # type: ignore
-
-_field_vectors: List[np.ndarray] = []
-_field_texts: List[str] = []
-_field_lock = Lock()
+
+
+class _FieldBuffer:
+    """Append-only ``(N, D)`` float32 matrix of field vectors plus labels.
+
+    Capacity doubles when full, so appends are amortized O(1) and readers
+    get a contiguous view instead of re-stacking a list of arrays.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = capacity
+        self._buf: np.ndarray | None = None
+        self._n = 0
+        self._texts: List[str] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, text: str, vector: np.ndarray) -> None:
+        row = np.asarray(vector, dtype=np.float32).ravel()
+        with self._lock:
+            if self._buf is None:
+                self._buf = np.empty((self._capacity, row.size), dtype=np.float32)
+            elif self._n == self._buf.shape[0]:
+                grown = np.empty((2 * self._n, self._buf.shape[1]), dtype=np.float32)
+                grown[: self._n] = self._buf
+                self._buf = grown
+            self._buf[self._n] = row
+            self._n += 1
+            self._texts.append(text)
+
+    def snapshot(self) -> Tuple[np.ndarray, List[str]]:
+        """Return a view of the stored vectors and a copy of their labels.
+
+        Rows below the current count are never rewritten (growth copies
+        into a fresh array), so the view stays valid without the lock.
+        """
+
+        with self._lock:
+            if self._buf is None:
+                return np.empty((0, 0), dtype=np.float32), []
+            return self._buf[: self._n], list(self._texts)
+
+
+_field = _FieldBuffer()
+
+
+class _FieldProjector:
+    """Cached 3-D UMAP projection of the field vectors.
+
+    The reducer is fitted once and reused: vectors that arrive afterwards
+    are placed with ``transform``, and a full refit only happens once the
+    field has doubled in size since the last fit.
+    """
+
+    def __init__(self) -> None:
+        self._reducer: Any = None
+        self._fitted_n = 0
+        self._embedding = np.empty((0, 3), dtype=np.float32)
+        self._lock = Lock()
+
+    def project(self, vectors: np.ndarray) -> np.ndarray:
+        n = len(vectors)
+        with self._lock:
+            if self._reducer is None or n >= 2 * self._fitted_n:
+                from umap import UMAP
+
+                self._reducer = UMAP(
+                    n_neighbors=min(5, n - 1),
+                    n_components=3,
+                    # spectral init needs more points than components + 1
+                    init="spectral" if n > 4 else "random",
+                    random_state=42,
+                )
+                self._embedding = self._reducer.fit_transform(vectors)
+                self._fitted_n = n
+            elif n > len(self._embedding):
+                fresh = self._reducer.transform(vectors[len(self._embedding) :])
+                self._embedding = np.vstack([self._embedding, fresh])
+            return self._embedding[:n]
+
+
+_projector = _FieldProjector()
+# Payloads are already-compact float32 bytes, so permessage-deflate would only
+# burn CPU; 4 MiB frames leave room for large batched vectors.
+_SOCKET_OPTIONS: Dict[str, Any] = {"compression": None, "max_size": 2**22}
+
 _visualization_warning_emitted = False
+_visualization_error_emitted = False
+_binary_warning_emitted = False
 
 
 async def start_server(host: str = "0.0.0.0", port: int = 8765) -> None:
@@ -50,7 +144,7 @@ async def start_server(host: str = "0.0.0.0", port: int = 8765) -> None:
         finally:
             await _unregister_client(ws, connected, connection_lock)
 
-    async with websockets.serve(relay_handler, host, port):
+    async with websockets.serve(relay_handler, host, port, **_SOCKET_OPTIONS):
         print(f"🌀 AGORA Relay Server running on {host}:{port}")
         await asyncio.Future()
 
@@ -74,47 +168,195 @@ async def _unregister_client(
 
 
 async def _broadcast(
-    message: str,
+    message: str | bytes,
     sender: WebSocketServerProtocol,
     connected: set[WebSocketServerProtocol],
     lock: asyncio.Lock,
 ) -> None:
     async with lock:
-        peers = list(connected)
-    coroutines = [peer.send(message) for peer in peers if peer is not sender]
-    if coroutines:
-        await asyncio.gather(*coroutines)
+        peers = [peer for peer in connected if peer is not sender]
+    # broadcast() writes the frame to every open peer without scheduling a
+    # coroutine per peer; closed peers are skipped and pruned on unregister.
+    websockets.broadcast(peers, message)
+
+
+class _ClientPool:
+    """Long-lived client connections to AGORA servers, one per URI.
+
+    Connections are bound to the event loop that opened them, so a pool is
+    kept per loop (see :func:`_client_pool`).
+    """
+
+    def __init__(self) -> None:
+        self._connections: Dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+
+    async def connection(self, server_uri: str, *, fresh: bool = False) -> Any:
+        async with self._lock:
+            conn = self._connections.get(server_uri)
+            if fresh or conn is None or _is_closed(conn):
+                conn = await websockets.connect(server_uri, **_SOCKET_OPTIONS)
+                self._connections[server_uri] = conn
+            return conn
+
+    async def send(self, server_uri: str, message: bytes | str) -> None:
+        conn = await self.connection(server_uri)
+        try:
+            await conn.send(message)
+        except websockets.exceptions.ConnectionClosed:
+            conn = await self.connection(server_uri, fresh=True)
+            await conn.send(message)
+
+    async def send_many(self, server_uri: str, messages: Sequence[bytes | str]) -> None:
+        conn = await self.connection(server_uri)
+        results = await asyncio.gather(
+            *(conn.send(message) for message in messages), return_exceptions=True
+        )
+        failed = []
+        for message, result in zip(messages, results):
+            if isinstance(result, websockets.exceptions.ConnectionClosed):
+                failed.append(message)
+            elif isinstance(result, BaseException):
+                raise result
+        if failed:
+            # a stale pooled connection: resend what it dropped on a fresh one
+            conn = await self.connection(server_uri, fresh=True)
+            await asyncio.gather(*(conn.send(message) for message in failed))
+
+    async def close(self) -> None:
+        async with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        await asyncio.gather(*(conn.close() for conn in connections))
+
+
+_client_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _client_pool() -> _ClientPool:
+    loop = asyncio.get_running_loop()
+    pool = _client_pools.get(loop)
+    if pool is None:
+        pool = _client_pools[loop] = _ClientPool()
+    return pool
+
+
+def _is_closed(conn: Any) -> bool:
+    state = getattr(conn, "state", None)
+    return state is not None and state.name in {"CLOSING", "CLOSED"}
+
+
+async def close_field_connections() -> None:
+    """Close the AGORA client connections opened on the running loop."""
+
+    await _client_pool().close()
 
 
 async def send_to_field(text: str, user: str, server_uri: str) -> None:
     """Encode *text* and publish it to the AGORA field."""
 
-    vector = _get_embedder().encode(text).tolist()
-    payload = {
-        "user": user,
-        "text": text,
-        "vector": vector,
-        "timestamp": time.time(),
-    }
-    async with websockets.connect(server_uri) as ws:
-        await ws.send(json.dumps(payload))
-        print(f"📡 Sent → AGORA: {text}")
+    vector = await asyncio.wrap_future(_get_batcher().submit(text))
+    payload = {"user": user, "text": text, "timestamp": time.time()}
+    await _client_pool().send(server_uri, _encode_message(payload, vector))
+    print(f"📡 Sent → AGORA: {text}")
+
+
+async def send_many(texts: Sequence[str], user: str, server_uri: str) -> None:
+    """Encode *texts* in one batch and publish them over a shared connection."""
+
+    if not texts:
+        return
+    loop = asyncio.get_running_loop()
+    vectors = await loop.run_in_executor(None, _get_batcher().encode_many, texts)
+    timestamp = time.time()
+    messages = [
+        _encode_message({"user": user, "text": text, "timestamp": timestamp}, vector)
+        for text, vector in zip(texts, vectors)
+    ]
+    await _client_pool().send_many(server_uri, messages)
+    print(f"📡 Sent → AGORA: {len(messages)} messages")
+
+
+async def listen_to_field(server_uri: str, *, min_refresh_interval: float = 0.5) -> None:
+    """Listen for messages from the AGORA field and visualize updates.
+
+    Rendering runs in a background task that coalesces bursts of messages
+    and refreshes at most once per *min_refresh_interval* seconds, so the
+    receive loop never waits on UMAP.
+    """
+
+    global _binary_warning_emitted
+
+    dirty = asyncio.Event()
+    refresher = asyncio.create_task(_refresh_visualization(dirty, min_refresh_interval))
+    try:
+        async with websockets.connect(server_uri, **_SOCKET_OPTIONS) as ws:
+            async for message in ws:
+                if isinstance(message, bytes) and msgpack is None:
+                    if not _binary_warning_emitted:
+                        print("⚠️ msgpack unavailable; ignoring binary AGORA messages.")
+                        _binary_warning_emitted = True
+                    continue
+                data = _decode_message(message)
+                _store_field_update(data["text"], data["vector"])
+                dirty.set()
+    finally:
+        refresher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await refresher
+
+
+async def _refresh_visualization(dirty: asyncio.Event, min_interval: float) -> None:
+    global _visualization_error_emitted
+
+    loop = asyncio.get_running_loop()
+    while True:
+        await dirty.wait()
+        dirty.clear()
+        try:
+            await loop.run_in_executor(None, visualize_field)
+        except Exception as exc:
+            # keep refreshing: a failed render (e.g. a UMAP error on a
+            # degenerate field) must not end visualization for the session
+            if not _visualization_error_emitted:
+                print(f"⚠️ AGORA visualization failed: {exc!r}")
+                _visualization_error_emitted = True
+        await asyncio.sleep(min_interval)
+
+
+def _encode_message(payload: Dict[str, Any], vector: np.ndarray) -> bytes | str:
+    """Serialize an AGORA message, shipping *vector* as float32.
+
+    With msgpack the vector is a raw little-endian ``bin`` field inside a
+    binary frame; otherwise the payload falls back to a JSON text frame.
+    """
 
+    vector = np.ascontiguousarray(vector, dtype="<f4")
+    if msgpack is not None:
+        return msgpack.packb({**payload, "vector": vector.tobytes()})
+    if orjson is not None:
+        return orjson.dumps(
+            {**payload, "vector": vector}, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    return json.dumps({**payload, "vector": vector.tolist()})
 
-async def listen_to_field(server_uri: str) -> None:
-    """Listen for messages from the AGORA field and visualize updates."""
 
-    async with websockets.connect(server_uri) as ws:
-        async for message in ws:
-            data = json.loads(message)
-            _store_field_update(data["text"], np.array(data["vector"]))
-            visualize_field()
+def _decode_message(message: bytes | str) -> Dict[str, Any]:
+    """Inverse of :func:`_encode_message`; ``vector`` comes back as float32."""
+
+    if isinstance(message, bytes):
+        data = msgpack.unpackb(message)
+        data["vector"] = np.frombuffer(data["vector"], dtype="<f4")
+        return data
+    data = orjson.loads(message) if orjson is not None else json.loads(message)
+    data["vector"] = np.asarray(data["vector"], dtype=np.float32)
+    return data
 
 
 def _store_field_update(text: str, vector: np.ndarray) -> None:
-    with _field_lock:
-        _field_texts.append(text)
-        _field_vectors.append(vector)
+    _field.append(text, vector)
 
 
 def visualize_field() -> None:
@@ -122,11 +364,9 @@ def visualize_field() -> None:
 
     global _visualization_warning_emitted
 
-    with _field_lock:
-        if len(_field_vectors) < 3:
-            return
-        vectors = np.array(_field_vectors)
-        labels = list(_field_texts)
+    vectors, labels = _field.snapshot()
+    if len(vectors) < 3:
+        return
 
     if not UMAP_AVAILABLE:
         if not _visualization_warning_emitted:
@@ -140,12 +380,9 @@ def visualize_field() -> None:
             _visualization_warning_emitted = True
         return
 
-    reducer = UMAP(
-        n_neighbors=min(5, len(vectors) - 1),
-        n_components=3,
-        random_state=42,
-    )
-    embedding = reducer.fit_transform(vectors)
+    import plotly.graph_objects as go
+
+    embedding = _projector.project(vectors)
     figure = go.Figure(
         data=[
             go.Scatter3d(
@@ -175,6 +412,8 @@ def _can_render() -> bool:
 __all__ = [
     "start_server",
     "send_to_field",
+    "send_many",
+    "close_field_connections",
     "listen_to_field",
     "visualize_field",
 ]
@@ -1,8 +1,13 @@
 """Dirac Hamiltonian dynamics used by the core system."""
 
 from __future__ import annotations
+
+import math
+
+import numpy as np
+
 from .geometry import IcosahedralField
-from .utils import to_psi3
+from .utils import njit, to_psi3
 
 # Prefer the Colab helper if available; otherwise define a local fallback.
 try:
@@ -14,7 +19,7 @@ except Exception:
 
     _ArrayLike = _Union[_np.ndarray, _Iterable[float]]
 
-    def to_psi3(vec: _ArrayLike) -> _np.ndarray:
+    def to_psi3(vec: _ArrayLike, out: _np.ndarray | None = None) -> _np.ndarray:
         """
         Map an arbitrary 1D/2D vector into a 3D psi vector compatible with
         DiracHamiltonian.
@@ -22,8 +27,10 @@ except Exception:
         - If dim >= 3, take the first 3 components.
         - If dim < 3, pad with zeros.
         - If a batch is provided (2D), use the first row.
+        - If `out` (a length-3 array) is given, fill and return it instead
+          of allocating.
         """
-        arr = _np.asarray(vec, dtype=_np.float32)
+        arr = _np.asarray(vec) if out is not None else _np.asarray(vec, dtype=_np.float32)
 
         if arr.ndim == 2:
             if arr.shape[0] == 0:
@@ -33,6 +40,14 @@ except Exception:
         if arr.ndim != 1:
             raise ValueError(f"to_psi3 expects a 1D vector or 2D batch, got {arr.shape}")
 
+        if out is not None:
+            if arr.shape[0] >= 3:
+                out[:] = arr[:3]
+            else:
+                out[:] = 0.0
+                out[: arr.shape[0]] = arr
+            return out
+
         if arr.shape[0] >= 3:
             return arr[:3].copy()
 
@@ -40,7 +55,18 @@ except Exception:
         out[: arr.shape[0]] = arr
         return out
 
-import numpy as np
+
+@njit(cache=True, fastmath=True)
+def _h_moments(psi: np.ndarray) -> tuple[float, float]:
+    """``(psi·psi, sum(psi))`` from a single pass over *psi*."""
+
+    s2 = 0.0
+    s = 0.0
+    for x in psi:
+        s2 += float(x) * float(x)
+        s += float(x)
+    return s2, s
+
 
 class DiracHamiltonian:
     """Simplified discrete Hamiltonian operating on resonance output."""
@@ -48,21 +74,31 @@ class DiracHamiltonian:
     def __init__(self, field: IcosahedralField) -> None:
         self.field = field
         self.m = 1.0
-        # Start with a small identity metric; it will be resized on demand.
-        self.gamma = np.eye(1)
+        # The Dirac metric is an identity scaled by gamma_scale, so the
+        # kinetic term needs no matrix: <psi|gamma|psi> = gamma_scale * psi·psi.
+        self.gamma_scale = 1.0
+        # scratch psi reused by every H call (so H is not thread-safe)
+        self._psi3_buf = np.zeros(3, dtype=np.float32)
 
     def H(self, psi: np.ndarray) -> float:
-        """Compute the Hamiltonian energy for the provided wavefunction."""
+        """Compute the Hamiltonian energy for the provided wavefunction.
+
+        The 3-component psi is written into a per-instance buffer, so one
+        instance must not be shared by concurrent callers.
+        """
 
         # Accept variable-length inputs by mapping into a 3-component psi.
-        psi3 = to_psi3(psi)
-
-        d = float(np.linalg.norm(psi3))
-        V = self.field.V_log(d)
-        # kinetic term: <psi | gamma | psi>
-        kinetic = float(np.sum(psi3.T @ (self.gamma @ psi3)))
-        mass_term = self.m * float(np.sum(psi3))
-        return kinetic + mass_term + V
+        psi3 = to_psi3(psi, out=self._psi3_buf)
+
+        # both reductions in one pass; the norm for the potential is sqrt(s2)
+        s2, s = _h_moments(psi3)
+        V = self.field.V_log(math.sqrt(s2))
+        return self.gamma_scale * s2 + self.m * s + V
+
+    def H_scalar(self, f: float) -> float:
+        """Energy of the single-mode state psi = (f, 0, 0), computed without arrays."""
+
+        return self.gamma_scale * f * f + self.m * f + self.field.V_log(abs(f))
 
 
 __all__ = ["DiracHamiltonian"]
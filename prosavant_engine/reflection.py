@@ -3,10 +3,24 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import time
 from typing import Dict, Iterable, List
 
+try:  # orjson is optional; a much faster JSON codec
+    import orjson  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads_line(line: bytes) -> Dict[str, float]:
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # NaN / Infinity written by the stdlib encoder are not strict JSON
+        return json.loads(line)
+
 
 class OmegaReflection:
     """Persistent logger for Φ/Ω resonance metrics."""
@@ -19,12 +33,20 @@ class OmegaReflection:
 
     def log(self, phi: float, omega: float) -> None:
         entry = {"time": time.time(), "phi": float(phi), "omega": float(omega)}
+        # orjson would write NaN/Infinity as null; keep those on the json path
+        if orjson is not None and math.isfinite(entry["phi"]) and math.isfinite(entry["omega"]):
+            with open(self.log_path, "ab") as handle:
+                handle.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+            return
         with open(self.log_path, "a", encoding="utf-8") as handle:
             handle.write(json.dumps(entry) + "\n")
 
     def entries(self) -> List[Dict[str, float]]:
         if not os.path.exists(self.log_path):
             return []
+        if orjson is not None:
+            with open(self.log_path, "rb") as handle:
+                return [_loads_line(line) for line in handle if line.strip()]
         with open(self.log_path, "r", encoding="utf-8") as handle:
             return [json.loads(line) for line in handle if line.strip()]
 
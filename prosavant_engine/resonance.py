@@ -2,29 +2,214 @@
 
 from __future__ import annotations
 
-from threading import Lock
-from typing import Dict, Iterable
+import cmath
+import math
+import os
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
 
 import numpy as np
-from scipy.fft import fft, fftfreq
-from sentence_transformers import SentenceTransformer
 
+from ._thread_config import configure_torch_threads
 from .config import DEFAULT_MODEL_NAME
+from .utils import njit
+
+if TYPE_CHECKING:  # pragma: no cover - importing torch is deferred to first use
+    from sentence_transformers import SentenceTransformer
+
+_N_SAMPLES = 2048
+_SAMPLE_RATE = 44100
+# Time and frequency axes are fixed for every simulation; build them once.
+_T = np.linspace(0, 1, _N_SAMPLES, dtype=np.float32)
+_FREQS = np.fft.rfftfreq(_N_SAMPLES, 1 / _SAMPLE_RATE)
+_SEMITONE_RATIOS = np.exp2(np.arange(12) / 12.0)
+
+
+@njit(cache=True)
+def _dirichlet(theta: float, n: int) -> complex:
+    """Closed form of ``sum(exp(1j * theta * j) for j in range(n))``."""
+
+    z = cmath.exp(1j * theta)
+    if abs(1.0 - z) < 1e-12:
+        return n + 0j
+    return (1.0 - cmath.exp(1j * theta * n)) / (1.0 - z)
+
+
+@njit(cache=True)
+def _peak_bin(freq: float, n: int) -> int:
+    """Index of the largest ``rfft`` magnitude of ``sin(2*pi*freq*linspace(0, 1, n))``.
+
+    A sampled sinusoid's DFT is the difference of two Dirichlet kernels, so
+    only the bins around the (aliased) tone frequency need evaluating.
+    """
+
+    omega = 2.0 * math.pi * freq / (n - 1)
+    centre = (freq * n / (n - 1)) % n
+    if centre > n / 2:
+        centre = n - centre
+    k0 = int(centre)
+    best = 0
+    best_mag = -1.0
+    for k in range(max(k0 - 1, 0), min(k0 + 2, n // 2) + 1):
+        phi = 2.0 * math.pi * k / n
+        mag = abs(_dirichlet(omega - phi, n) - _dirichlet(-omega - phi, n))
+        # keep the lower bin on ties, matching np.argmax
+        if mag > best_mag * (1.0 + 1e-12):
+            best = k
+            best_mag = mag
+    return best
+
+
+@lru_cache(maxsize=256)
+def _tone(freq: float) -> Tuple[np.ndarray, float]:
+    """Synthesize the pure tone at *freq* and its dominant spectral frequency.
+
+    The peak is located analytically (see :func:`_peak_bin`) instead of by an
+    FFT of the signal. Results are memoized, so the signal is read-only.
+    """
+
+    signal = np.multiply(_T, 2 * np.pi * freq, dtype=np.float32)
+    np.sin(signal, out=signal)
+    signal.setflags(write=False)
+    return signal, float(_FREQS[_peak_bin(freq, _N_SAMPLES)])
+
+
+ENV_EMBED_BACKEND = "SAVANT_EMBED_BACKEND"
+ENV_EMBED_ONNX_FILE = "SAVANT_EMBED_ONNX_FILE"
+# Dynamically int8-quantized export shipped with the MiniLM hub repository.
+DEFAULT_ONNX_FILE = "onnx/model_quint8_avx2.onnx"
 
 _embedder: SentenceTransformer | None = None
 _embedder_lock = Lock()
 
 
+def _load_embedder() -> SentenceTransformer:
+    """Build the embedding model for the backend selected via the environment.
+
+    ``SAVANT_EMBED_BACKEND=onnx`` loads a quantized ONNX Runtime export
+    (``SAVANT_EMBED_ONNX_FILE`` picks the file); the default ``torch``
+    backend switches to FP16 when the model lands on a CUDA device.
+    """
+
+    from sentence_transformers import SentenceTransformer
+
+    configure_torch_threads()
+    backend = os.getenv(ENV_EMBED_BACKEND, "torch").strip().lower()
+    if backend == "onnx":
+        return SentenceTransformer(
+            DEFAULT_MODEL_NAME,
+            backend="onnx",
+            model_kwargs={"file_name": os.getenv(ENV_EMBED_ONNX_FILE, DEFAULT_ONNX_FILE)},
+        )
+    if backend != "torch":
+        raise ValueError(
+            f"Unsupported {ENV_EMBED_BACKEND}={backend!r}; expected 'torch' or 'onnx'."
+        )
+    model = SentenceTransformer(DEFAULT_MODEL_NAME)
+    if model.device.type == "cuda":
+        model.half()
+    return model
+
+
 def get_embedder() -> SentenceTransformer:
     """Return a shared SentenceTransformer instance, loading lazily."""
 
     global _embedder
     with _embedder_lock:
         if _embedder is None:
-            _embedder = SentenceTransformer(DEFAULT_MODEL_NAME)
+            _embedder = _load_embedder()
     return _embedder
 
 
+class EmbeddingBatcher:
+    """Coalesce single-text encode requests into batched model calls.
+
+    Requests are queued together with a :class:`~concurrent.futures.Future`;
+    a daemon worker drains up to *max_batch_size* of them (waiting at most
+    *max_wait_ms* for stragglers) and resolves every future from one
+    ``encode`` call.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait_ms: float = 5.0) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Queue[Tuple[str, Future]] = Queue()
+        self._worker: Thread | None = None
+        self._worker_lock = Lock()
+
+    def submit(self, text: str) -> Future:
+        """Queue *text* for encoding and return a future for its vector."""
+
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str) -> np.ndarray:
+        """Encode a single *text*, blocking until its batch completes."""
+
+        return self.submit(text).result()
+
+    def encode_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode *texts* directly in a single batched call."""
+
+        return get_embedder().encode(list(texts), batch_size=self.max_batch_size)
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(
+                    target=self._run, name="prosavant-embedder", daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self) -> List[Tuple[str, Future]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except Empty:
+                break
+        # Drop requests whose caller gave up while they were queued.
+        return [item for item in batch if item[1].set_running_or_notify_cancel()]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if not batch:
+                continue
+            try:
+                vectors = self.encode_many([text for text, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+
+
+_batcher: EmbeddingBatcher | None = None
+_batcher_lock = Lock()
+
+
+def get_batcher() -> EmbeddingBatcher:
+    """Return the shared :class:`EmbeddingBatcher` instance."""
+
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = EmbeddingBatcher()
+    return _batcher
+
+
 class ResonanceSimulator:
     """Converts text into a synthetic waveform and FFT spectrum."""
 
@@ -32,14 +217,31 @@ class ResonanceSimulator:
         self.freq_base = freq_base
 
     def simulate(self, text: str) -> Dict[str, np.ndarray | float]:
-        embedder = get_embedder()
-        vector = embedder.encode(text)
+        # Encoded on its own rather than through the micro-batcher: a padded
+        # batch encode is not bit-identical to a single one, and ulp-level
+        # norm changes flip the tone (see _resonate), so the result would
+        # depend on whatever other texts shared the batch.
+        return self._resonate(get_embedder().encode(text))
+
+    def simulate_many(self, texts: Sequence[str]) -> List[Dict[str, np.ndarray | float]]:
+        """Simulate several texts, sharing a single batched embedding pass.
+
+        The embeddings come from one padded batch, so a text's
+        ``dominant_frequency`` here may differ from :meth:`simulate`'s.
+        """
+
+        if not texts:
+            return []
+        vectors = get_batcher().encode_many(texts)
+        return [self._resonate(vector) for vector in vectors]
+
+    def _resonate(self, vector: np.ndarray) -> Dict[str, np.ndarray | float]:
+        # Unit-norm embeddings put ``norm % 0.1`` right at its wrap point, so
+        # the norm must be computed exactly as numpy does in the vector's own
+        # dtype: a few ulps decide between a ~440 Hz and a ~484 Hz tone.
         base = float(np.linalg.norm(vector))
-        freq = self.freq_base * (1 + (base % 0.1))
-        t = np.linspace(0, 1, 2048)
-        signal = np.sin(2 * np.pi * freq * t)
-        spectrum = np.abs(fft(signal))[:1024]
-        dom_freq = float(fftfreq(2048, 1 / 44100)[:1024][np.argmax(spectrum)])
+        freq = self.freq_base * (1 + base % 0.1)
+        signal, dom_freq = _tone(round(freq, 3))
         return {"signal": signal, "dominant_frequency": dom_freq, "embedding": vector}
 
     @property
@@ -49,10 +251,18 @@ class ResonanceSimulator:
         return get_embedder()
 
 
-def harmonic_quantization(base_freq: float = 440.0, steps: int = 12) -> Iterable[float]:
+def harmonic_quantization(base_freq: float = 440.0, steps: int = 12) -> np.ndarray:
     """Generate an equal-tempered scale anchored at *base_freq*."""
 
-    return [base_freq * (2 ** (k / 12)) for k in range(steps)]
+    if steps == 12:
+        return base_freq * _SEMITONE_RATIOS
+    return base_freq * np.exp2(np.arange(steps, dtype=np.float64) / 12.0)
 
 
-__all__ = ["ResonanceSimulator", "harmonic_quantization", "get_embedder"]
+__all__ = [
+    "ResonanceSimulator",
+    "EmbeddingBatcher",
+    "harmonic_quantization",
+    "get_embedder",
+    "get_batcher",
+]
@@ -8,6 +8,17 @@ from typing import Iterable
 import numpy as np
 from numpy.typing import ArrayLike
 
+try:  # numba is optional; kernels degrade to plain Python without it
+    from numba import njit  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover - exercised only when numba is absent
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for :func:`numba.njit`."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 def _hash_to_unit_vector(text: str) -> np.ndarray:
     digest = hashlib.sha256(text.encode("utf-8")).digest()
@@ -0,0 +1,126 @@
+"""Parity checks for the CSV backends in prosavant_engine.data."""
+
+import math
+
+import numpy as np
+import pytest
+
+from prosavant_engine import data
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow.csv")
+
+FREQUENCIES = {
+    "plain": "note,frequency\nA4,440.0\nB4,493.883\nC5,523.251\n",
+    "integers": "note,frequency\nA4,440\nA5,880\n",
+    "gaps": "note,frequency\nA4,440.0\n,\nC5,\n\nD5,587.33\n",
+    "ragged": "note,frequency\nA4,440.0\nB4\nC5,523.251\n",
+    "text": "note,frequency\nA4,440.0\nB4,n/a\nC5,523.251\n",
+    "na_tokens": "note,frequency\nNA,440.0\nB4,NULL\nC5,#N/A\n",
+    "header_only": "note,frequency\n",
+}
+CONSTANTS = {
+    "plain": "name,value\nc,299792458\nh,6.62607015e-34\npi,3.14159\n",
+    "gaps": "name,value\nc,299792458\nh,\n,1.0\n",
+    "text": "name,value\nc,299792458\nh,unknown\n",
+}
+
+BACKENDS = ("arrow", "pandas", "csv")
+
+
+def _use_backend(monkeypatch, backend):
+    # force files past the small-file fast path so each backend really runs
+    monkeypatch.setattr(data, "_SMALL_CSV_BYTES", 0)
+    if backend in ("pandas", "csv"):
+        monkeypatch.setattr(data, "pacsv", None)
+    if backend == "csv":
+        monkeypatch.setattr(data, "pd", None)
+
+
+def _normalize(value):
+    if isinstance(value, float) and math.isnan(value):
+        return "NaN"
+    return value
+
+
+def _column_values(array):
+    return [_normalize(v.item() if isinstance(v, np.generic) else v) for v in array]
+
+
+def _repository(tmp_path, name, text):
+    (tmp_path / name).write_text(text, encoding="utf-8")
+    return data.DataRepository(base_path=tmp_path)
+
+
+CASES = [
+    pytest.param(name, text, id=f"{name.split('.')[0]}-{key}")
+    for name, texts in (("frequencies.csv", FREQUENCIES), ("constants.csv", CONSTANTS))
+    for key, text in texts.items()
+]
+
+
+def _load(tmp_path, monkeypatch, backend, name, text):
+    _use_backend(monkeypatch, backend)
+    repo = _repository(tmp_path / backend, name, text)
+    if name == "frequencies.csv":
+        return (
+            repo.load_frequencies(),
+            repo.load_frequencies_columnar(),
+            repo.load_frequency_values(),
+        )
+    return repo.load_constants(), repo.load_constants_columnar(), repo.load_constant_values()
+
+
+@pytest.fixture
+def loaded(tmp_path, monkeypatch):
+    def load(backend, name, text):
+        with monkeypatch.context() as patch:
+            (tmp_path / backend).mkdir()
+            return _load(tmp_path, patch, backend, name, text)
+
+    return load
+
+
+@pytest.mark.parametrize("name,text", CASES)
+def test_columnar_matches_across_backends(loaded, name, text):
+    results = {backend: loaded(backend, name, text)[1] for backend in BACKENDS}
+    expected = results["arrow"]
+    for backend in BACKENDS[1:]:
+        columns = results[backend]
+        assert list(columns) == list(expected), backend
+        for column, values in expected.items():
+            assert columns[column].dtype == values.dtype, (backend, column)
+            assert _column_values(columns[column]) == _column_values(values), (backend, column)
+
+
+@pytest.mark.parametrize("name,text", CASES)
+def test_values_match_across_backends(loaded, name, text):
+    results = {backend: loaded(backend, name, text)[2] for backend in BACKENDS}
+    for backend in BACKENDS[1:]:
+        assert results[backend].dtype == np.float64
+        np.testing.assert_array_equal(results[backend], results["arrow"], err_msg=backend)
+
+
+@pytest.mark.parametrize("name,text", CASES)
+def test_records_match_between_arrow_and_pandas(loaded, name, text):
+    arrow, pandas = (loaded(backend, name, text)[0] for backend in ("arrow", "pandas"))
+    assert [{k: _normalize(v) for k, v in row.items()} for row in arrow] == [
+        {k: _normalize(v) for k, v in row.items()} for row in pandas
+    ]
+
+
+@pytest.mark.parametrize("name,text", CASES)
+def test_small_file_records_match_pandas(tmp_path, monkeypatch, name, text):
+    repo = _repository(tmp_path, name, text)
+    small = repo._load_csv(name)
+    monkeypatch.setattr(data, "_SMALL_CSV_BYTES", 0)
+    monkeypatch.setattr(data, "pacsv", None)
+    pandas = data._parse_csv(tmp_path / name)
+    assert [{k: _normalize(v) for k, v in row.items()} for row in small] == [
+        {k: _normalize(v) for k, v in row.items()} for row in pandas
+    ]
+
+
+def test_values_coerce_text_to_nan(tmp_path):
+    repo = _repository(tmp_path, "frequencies.csv", FREQUENCIES["text"])
+    np.testing.assert_array_equal(repo.load_frequency_values(), [440.0, np.nan, 523.251])
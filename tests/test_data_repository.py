@@ -0,0 +1,175 @@
+"""Lookup, memo invalidation and JSON parsing checks for prosavant_engine.data."""
+
+import dataclasses
+import json
+import os
+
+import pytest
+
+from prosavant_engine import data
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_file_created_after_first_load_is_found(tmp_path):
+    _write(tmp_path / "frequencies.csv", "note,frequency\nA4,440.0\n")
+    repo = data.DataRepository(base_path=tmp_path)
+    # caches the directory listings, which predate constants.csv
+    assert repo.load_frequencies() == [{"note": "A4", "frequency": 440.0}]
+
+    _write(tmp_path / "constants.csv", "name,value\nc,299792458\n")
+    assert repo.load_constants() == [{"name": "c", "value": 299792458.0}]
+
+
+def test_file_created_after_a_miss_is_found(tmp_path):
+    _write(tmp_path / "frequencies.csv", "note,frequency\nA4,440.0\n")
+    repo = data.DataRepository(base_path=tmp_path)
+    assert repo.load_constants() == []
+
+    _write(tmp_path / "constants.csv", "name,value\nc,299792458\n")
+    assert repo.load_constants() == [{"name": "c", "value": 299792458.0}]
+
+
+def test_structured_root_search_does_not_follow_symlinks(tmp_path):
+    top = tmp_path / "dataset"
+    (top / "inner").mkdir(parents=True)
+    # two links back to an ancestor would make a link-following walk explode
+    (top / "inner" / "loop_a").symlink_to(top, target_is_directory=True)
+    (top / "inner" / "loop_b").symlink_to(top, target_is_directory=True)
+    repo = data.DataRepository(base_path=tmp_path)
+    assert repo._locate_structured_root(top) is None
+
+    _write(top / "inner" / "equations.json", "[]")
+    assert repo._locate_structured_root(top) == top / "inner"
+
+
+def _dataset(tmp_path):
+    _write(tmp_path / "equations.json", '{"ecuaciones": [{"id": 1}]}')
+    _write(tmp_path / "icosahedron_nodes.json", '{"nodes": [{"id": 0, "x": 1.0}]}')
+    _write(tmp_path / "frequencies.csv", "note,frequency\nA4,440.0\n")
+    _write(tmp_path / "constants.csv", "name,value\nc,299792458\n")
+    return data.DataRepository(base_path=tmp_path)
+
+
+def test_bundle_shares_memoized_results_with_loaders(tmp_path):
+    repo = _dataset(tmp_path)
+    bundle = repo.load_structured_bundle()
+    assert repo.load_equations() is bundle["equations"]
+    assert repo.load_icosahedron_nodes() is bundle["icosahedron_nodes"]
+    assert repo.load_frequencies() is bundle["frequencies"]
+    assert repo.load_constants() is bundle["constants"]
+    assert bundle["dodecahedron_nodes"] == [] and bundle["full_fractal_memory"] is None
+
+
+def test_warm_bundle_stats_each_file_once(tmp_path, monkeypatch):
+    repo = _dataset(tmp_path)
+    repo.load_structured_bundle()
+    stats = []
+    original = data.Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stats.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(data.Path, "stat", counting_stat)
+    repo.load_structured_bundle()
+    # absent files are probed with is_file(); each present one is stat-ed once
+    present = {path.name for path in tmp_path.iterdir()}
+    assert sorted(name for name in stats if name in present) == sorted(present)
+
+
+def test_caches_stay_out_of_equality_and_asdict(tmp_path):
+    repo = _dataset(tmp_path)
+    repo.load_structured_bundle()
+    assert repo == data.DataRepository(base_path=tmp_path)
+    assert set(dataclasses.asdict(repo)) == {
+        "base_path", "additional_paths", "remote_dataset", "cache_dir", "log_filename"
+    }
+
+
+def _rewrite(path, text):
+    # bump the mtime explicitly so same-size rewrites are seen on coarse clocks
+    st = path.stat()
+    _write(path, text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_loaders_follow_removed_files(tmp_path):
+    repo = _dataset(tmp_path)
+    assert repo.load_equations() == [{"id": 1}]
+    assert repo.load_constants() == [{"name": "c", "value": 299792458.0}]
+
+    (tmp_path / "equations.json").unlink()
+    (tmp_path / "constants.csv").unlink()
+    assert repo.load_equations() == []
+    assert repo.load_constants() == []
+
+
+def test_loaders_follow_rewritten_files(tmp_path):
+    repo = _dataset(tmp_path)
+    assert repo.load_frequencies() == [{"note": "A4", "frequency": 440.0}]
+    assert repo.load_icosahedron_nodes() == [{"id": 0, "x": 1.0}]
+
+    # same byte length, so only the mtime changes
+    _rewrite(tmp_path / "frequencies.csv", "note,frequency\nB4,493.9\n")
+    _rewrite(tmp_path / "icosahedron_nodes.json", '{"nodes": [{"id": 7, "x": 2.0}]}')
+    assert repo.load_frequencies() == [{"note": "B4", "frequency": 493.9}]
+    assert repo.load_icosahedron_nodes() == [{"id": 7, "x": 2.0}]
+
+
+def test_bundle_follows_added_removed_and_rewritten_files(tmp_path):
+    repo = _dataset(tmp_path)
+    before = repo.load_structured_bundle()
+    assert before["equations"] == [{"id": 1}]
+    assert before["dodecahedron_nodes"] == []
+
+    (tmp_path / "equations.json").unlink()
+    _write(tmp_path / "nodes_dodecahedron.json", '{"nodes": [{"id": 3}]}')
+    _rewrite(tmp_path / "constants.csv", "name,value\nh,662607015\n")
+    after = repo.load_structured_bundle()
+    assert after["equations"] == []
+    assert after["dodecahedron_nodes"] == [{"id": 3}]
+    assert after["constants"] == [{"name": "h", "value": 662607015.0}]
+    # untouched files keep their memoized results
+    assert after["frequencies"] is before["frequencies"]
+    assert after["icosahedron_nodes"] is before["icosahedron_nodes"]
+
+
+JSON_DOCUMENTS = [
+    '{"nodes": [{"id": 1}], "rest": [1, 2]}',
+    '{"ecuaciones_maestras": [{"a": 1}], "ecuaciones": []}',
+    '{"other": {"nodes": [1]}}',
+    '[{"x": 1.5}]',
+    "5",
+]
+CORRUPT_JSON = ['{"nodes": [1]} trailing', '{"nodes": [1], "rest": [1, ', '[1] [2]', ""]
+JSON_PARSERS = [
+    data._parse_equations, data._parse_icosahedron_nodes, data._parse_dodecahedron_nodes
+]
+
+
+def _parse_json_both_ways(monkeypatch, parse, path):
+    """Results (or exception types) of *parse* with and without ijson streaming."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(data, "orjson", None)
+    outcomes = []
+    for ijson in (data.ijson, None):
+        monkeypatch.setattr(data, "ijson", ijson)
+        try:
+            outcomes.append(parse(path))
+        except ValueError as exc:
+            outcomes.append(type(exc))
+    return outcomes
+
+
+@pytest.mark.parametrize("text", JSON_DOCUMENTS + CORRUPT_JSON)
+@pytest.mark.parametrize("parse", JSON_PARSERS)
+def test_streamed_json_matches_full_parse(tmp_path, monkeypatch, parse, text):
+    path = _write(tmp_path / "doc.json", text)
+    streamed, full = _parse_json_both_ways(monkeypatch, parse, path)
+    assert streamed == full
+    if text in CORRUPT_JSON:
+        assert full is json.JSONDecodeError
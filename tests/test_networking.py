@@ -0,0 +1,37 @@
+"""Checks for the AGORA field visualization refresher."""
+
+import asyncio
+
+import pytest
+
+networking = pytest.importorskip("prosavant_engine.networking")
+
+
+def test_refresher_survives_failed_renders(monkeypatch, capsys):
+    calls = []
+
+    def flaky_visualize():
+        calls.append(len(calls))
+        if len(calls) <= 2:
+            raise ValueError("degenerate field")
+
+    monkeypatch.setattr(networking, "visualize_field", flaky_visualize)
+    monkeypatch.setattr(networking, "_visualization_error_emitted", False)
+
+    async def run():
+        dirty = asyncio.Event()
+        refresher = asyncio.create_task(networking._refresh_visualization(dirty, 0))
+        for expected in (1, 2, 3):
+            dirty.set()
+            for _ in range(500):
+                if len(calls) == expected:
+                    break
+                await asyncio.sleep(0.001)
+        assert not refresher.done()
+        refresher.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await refresher
+
+    asyncio.run(run())
+    assert len(calls) == 3
+    assert capsys.readouterr().out.count("AGORA visualization failed") == 1
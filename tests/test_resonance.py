@@ -0,0 +1,67 @@
+"""Checks for the resonance simulator's spectral peak and frequency mapping."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from prosavant_engine import resonance
+from prosavant_engine.resonance import _FREQS, _N_SAMPLES, ResonanceSimulator, _peak_bin, _tone
+
+
+def _fft_peak_bin(freq: float, n: int = _N_SAMPLES) -> int:
+    signal = np.sin(2 * np.pi * freq * np.linspace(0, 1, n))
+    return int(np.argmax(np.abs(np.fft.rfft(signal))))
+
+
+# dense sweep across the simulator's tone range and well beyond it
+SWEEP = np.linspace(1.0, 2000.0, 4001)
+# tones whose DFT peak falls exactly halfway between two bins
+HALF_BIN_TIES = [(k + 0.5) * (_N_SAMPLES - 1) / _N_SAMPLES for k in range(1, 120)]
+
+
+@pytest.mark.parametrize("freq", [*SWEEP, *HALF_BIN_TIES])
+def test_peak_bin_matches_fft(freq):
+    assert _peak_bin(freq, _N_SAMPLES) == _fft_peak_bin(freq)
+
+
+def test_tone_reports_fft_dominant_frequency():
+    for freq in (440.0, 466.164, 483.999):
+        _, dominant = _tone(freq)
+        assert dominant == _FREQS[_fft_peak_bin(freq)]
+
+
+class _BatchSensitiveEmbedder:
+    """Fake model whose batched vectors drift by an ulp per extra text."""
+
+    def __init__(self):
+        self.inputs = []
+
+    def encode(self, texts, batch_size=32):
+        self.inputs.append(texts)
+        unit = np.full(384, 1 / np.sqrt(384), dtype=np.float32)
+        if isinstance(texts, str):
+            return unit
+        scale = np.float32(1 + (len(texts) - 1) * 2.0**-23)
+        return np.stack([unit * scale for _ in texts])
+
+
+def test_frequency_is_sensitive_to_ulp_level_norm_changes():
+    simulator = ResonanceSimulator()
+    unit = _BatchSensitiveEmbedder().encode("a")
+    nudged = unit * np.float32(1 + 2.0**-23)
+    assert (
+        simulator._resonate(unit)["dominant_frequency"]
+        != simulator._resonate(nudged)["dominant_frequency"]
+    )
+
+
+def test_simulate_does_not_depend_on_concurrent_texts(monkeypatch):
+    embedder = _BatchSensitiveEmbedder()
+    monkeypatch.setattr(resonance, "get_embedder", lambda: embedder)
+    simulator = ResonanceSimulator()
+    expected = simulator.simulate("alone")["dominant_frequency"]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(simulator.simulate, ["together"] * 32))
+    assert {result["dominant_frequency"] for result in results} == {expected}
+    assert all(isinstance(texts, str) for texts in embedder.inputs)